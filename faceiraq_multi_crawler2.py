@@ -3,8 +3,12 @@
 faceiraq.org 멀티 섹션 크롤러
 정치, 안보, 경제 섹션을 모두 수집하는 스크립트
 
+사전 준비:
+    pip install -r requirements.txt
+    playwright install chromium
+
 사용법:
-    python3 faceiraq_multi_crawler2.py [--hours HOURS] [--sections SECTIONS]
+    python3 faceiraq_multi_crawler2.py [--hours HOURS] [--sections SECTIONS] [--quiet]
     
 예시:
     # 모든 섹션 수집 (기본)
@@ -16,23 +20,155 @@ faceiraq.org 멀티 섹션 크롤러
     # 48시간 범위로 수집
     python3 faceiraq_multi_crawler2.py --hours 48
     
+    # 기사별/스크롤별 진행 로그 없이 수집
+    python3 faceiraq_multi_crawler2.py --quiet
+    
 출력:
     faceiraq_politics_YYYYMMDD_HHMMSS.json/csv
     faceiraq_security_YYYYMMDD_HHMMSS.json/csv
     faceiraq_economy_YYYYMMDD_HHMMSS.json/csv
 """
 
+import calendar
 import json
-import time
+import os
 import re
+import time
 import argparse
+import hashlib
+import logging
+import multiprocessing
 from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import csv
+from functools import lru_cache
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+
+# orjson 사용 (Rust 기반, 표준 json보다 빠름). 미설치 환경에서는 표준 json으로 대체
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 기사별/스크롤별 진행 로그 (--quiet이면 WARNING 이상만 출력)
+logger = logging.getLogger('faceiraq')
+
+CSV_FIELDNAMES = ['section', 'arabic_title', 'korean_title', 'publishDate', 'timeText', 'source', 'url']
+
+# CSV 행 형식 (고정 스키마이므로 csv 모듈 없이 모든 필드를 따옴표로 감싸서 직접 기록)
+# 필드 순서는 CSV_FIELDNAMES와 동일하며 korean_title은 빈 값 (GPT로 번역 필요)
+_CSV_ROW_FMT = '"{}","{}","","{}","{}","{}","{}"\n'
+
+
+def configure_logging(level=logging.INFO):
+    """진행 로그 핸들러 설정 (메인 프로세스와 각 워커 프로세스에서 호출)"""
+    logging.basicConfig(format='%(message)s', level=level)
+    logger.setLevel(level)
+
+
+def dumps_json(obj):
+    """객체를 UTF-8 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+# 시간 문자열 패턴 (parse_time에서 사용)
+_RE_HOURS = re.compile(r'منذ\s+(\d+)\s+ساعات?')
+_RE_MIN = re.compile(r'منذ\s+(\d+)\s+دقيقة')
+_RE_ABS = re.compile(r'(\d{1,2}):(\d{2})\s+(\d{1,2})-(\d{1,2})-(\d{4})')
+
+# 브라우저 안에서 cursor번째 이후 카드의 [제목, 시간, 출처, href]를 한 번에 추출
+# 반환값: [전체 카드 수, 새 카드 목록]
+# 카드 수가 커서보다 줄었으면(목록 재렌더링) 처음부터 다시 읽고, 중복은 seen_titles로 걸러낸다
+# 텍스트는 레이아웃 계산이 필요한 innerText 대신 textContent로 읽고 공백만 정리한다
+_EXTRACT_CARDS_JS = """
+cursor => {
+    const text = el => el ? el.textContent.replace(/\\s+/g, ' ').trim() : '';
+    const cards = document.querySelectorAll('div.v-card');
+    const start = cursor <= cards.length ? cursor : 0;
+    return [cards.length, Array.from(cards).slice(start).map(c => {
+        const t = c.querySelector('p.article-title');
+        const s = c.querySelector('div.v-card-subtitle');
+        const i = c.querySelector('img');
+        const a = c.querySelector('a[href]');
+        return [text(t), text(s), (i && i.title) || 'Unknown', a ? a.getAttribute('href') : ''];
+    })];
+}
+"""
+
+# 카드 수가 n개보다 많아질 때까지 대기하는 조건
+_MORE_CARDS_JS = "n => document.querySelectorAll('div.v-card').length > n"
+
+# 차단할 리소스 종류 (출처명은 <img title>에서 읽으므로 이미지 파일은 불필요)
+BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media'}
+
+
+@lru_cache(maxsize=1024)
+def classify_time(time_str):
+    """
+    시간 문자열을 (종류, 값) 튜플로 분류 (정규식 단계만 수행, 기준 시각과 무관)
+    
+    같은 섹션의 카드들은 "منذ 3 ساعات"처럼 같은 문자열을 반복하므로
+    결과를 캐시해 문자열당 한 번만 정규식을 실행한다.
+    
+    지원 형식:
+    1. "منذ X ساعات" (X시간 전)
+    2. "منذ X دقيقة" (X분 전)
+    3. "منذ ساعة واحدة" (1시간 전)
+    4. "HH:MM DD-MM-YYYY" (절대 시간)
+    
+    Returns:
+        ('ago', 분) / ('abs', UTC epoch 초) / (None, None) 파싱 실패
+    """
+    # 패턴 1: "منذ X ساعات" (X시간 전)
+    match = _RE_HOURS.search(time_str)
+    if match:
+        return 'ago', int(match.group(1)) * 60
+    
+    # 패턴 2: "منذ X دقيقة" (X분 전)
+    match = _RE_MIN.search(time_str)
+    if match:
+        return 'ago', int(match.group(1))
+    
+    # 패턴 3: "منذ ساعة واحدة" (1시간 전)
+    if 'منذ ساعة واحدة' in time_str or 'منذ ساعتين' in time_str:
+        hours_ago = 1 if 'واحدة' in time_str else 2
+        return 'ago', hours_ago * 60
+    
+    # 패턴 4: "HH:MM DD-MM-YYYY" (절대 시간)
+    match = _RE_ABS.search(time_str)
+    if match:
+        hour, minute, day, month, year = map(int, match.groups())
+        # 이라크 시간 (UTC+3)을 UTC로 변환
+        iraq_time = datetime(year, month, day, hour, minute)
+        return 'abs', calendar.timegm((iraq_time - timedelta(hours=3)).timetuple())
+    
+    return None, None
+
+
+def launch_browser(playwright):
+    """헤드리스 Chromium 실행 (섹션 워커마다 하나씩 사용)"""
+    return playwright.chromium.launch(headless=True, args=[
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--blink-settings=imagesEnabled=false',
+    ])
+
+
+def _block_resource(route):
+    """이미지/CSS/폰트/미디어 요청은 중단하고 나머지는 통과"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def create_page(browser):
+    """아랍어 로케일, 1920x1080 뷰포트, 리소스 차단이 설정된 페이지 생성"""
+    page = browser.new_page(locale='ar', viewport={'width': 1920, 'height': 1080})
+    page.route('**/*', _block_resource)
+    return page
+
 
 class FaceIraqMultiCrawler:
     # 섹션 정의
@@ -62,6 +198,8 @@ class FaceIraqMultiCrawler:
         """
         self.hours_limit = hours_limit
         self.cutoff_time = datetime.utcnow() - timedelta(hours=hours_limit)
+        # 카드 루프에서 int 비교만 하도록 epoch 초로도 보관
+        self.cutoff_epoch = calendar.timegm(self.cutoff_time.timetuple())
         
         # 수집할 섹션 결정
         if sections is None:
@@ -69,18 +207,9 @@ class FaceIraqMultiCrawler:
         else:
             self.target_sections = [s for s in sections if s in self.SECTIONS]
         
-        # Chrome 옵션 설정
-        chrome_options = Options()
-        chrome_options.page_load_strategy = "eager"
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--lang=ar')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # 결과 파일명 타임스탬프 및 섹션별 열린 출력 파일
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.outputs = {}
         
         # 섹션별 결과 저장
         self.results = {}
@@ -90,53 +219,39 @@ class FaceIraqMultiCrawler:
                 'seen_titles': set()
             }
     
-    def parse_time(self, time_str):
-        """
-        시간 문자열을 datetime 객체로 변환
-        
-        지원 형식:
-        1. "منذ X ساعات" (X시간 전)
-        2. "منذ X دقيقة" (X분 전)
-        3. "منذ ساعة واحدة" (1시간 전)
-        4. "HH:MM DD-MM-YYYY" (절대 시간)
+    def parse_time(self, time_str, now=None):
         """
-        time_str = time_str.strip()
-        
-        # 패턴 1: "منذ X ساعات" (X시간 전)
-        match = re.search(r'منذ\s+(\d+)\s+ساعات?', time_str)
-        if match:
-            hours_ago = int(match.group(1))
-            return datetime.utcnow() - timedelta(hours=hours_ago)
+        시간 문자열을 UTC epoch 초(int)로 변환
         
-        # 패턴 2: "منذ X دقيقة" (X분 전)
-        match = re.search(r'منذ\s+(\d+)\s+دقيقة', time_str)
-        if match:
-            minutes_ago = int(match.group(1))
-            return datetime.utcnow() - timedelta(minutes=minutes_ago)
+        Args:
+            time_str: 카드에 표시된 시간 문자열
+            now: 상대 시간 계산 기준 UTC epoch 초 (None이면 현재 시각)
         
-        # 패턴 3: "منذ ساعة واحدة" (1시간 전)
-        if 'منذ ساعة واحدة' in time_str or 'منذ ساعتين' in time_str:
-            hours_ago = 1 if 'واحدة' in time_str else 2
-            return datetime.utcnow() - timedelta(hours=hours_ago)
+        지원 형식은 classify_time 참고
+        """
+        if now is None:
+            now = int(time.time())
         
-        # 패턴 4: "HH:MM DD-MM-YYYY" (절대 시간)
-        match = re.search(r'(\d{1,2}):(\d{2})\s+(\d{1,2})-(\d{1,2})-(\d{4})', time_str)
-        if match:
-            hour, minute, day, month, year = map(int, match.groups())
-            # 이라크 시간 (UTC+3)을 UTC로 변환
-            iraq_time = datetime(year, month, day, hour, minute)
-            utc_time = iraq_time - timedelta(hours=3)
-            return utc_time
+        kind, value = classify_time(time_str.strip())
+        if kind == 'ago':
+            return now - value * 60
+        if kind == 'abs':
+            return value
         
         # 파싱 실패 시 현재 시간 반환
-        return datetime.utcnow()
+        return now
     
-    def is_within_time_limit(self, publish_date):
-        """기사가 시간 제한 내에 있는지 확인"""
-        return publish_date >= self.cutoff_time
+    def is_within_time_limit(self, publish_epoch):
+        """기사가 시간 제한 내에 있는지 확인 (publish_epoch: parse_time 결과)"""
+        return publish_epoch >= self.cutoff_epoch
     
-    def crawl_section(self, section_key):
-        """특정 섹션 크롤링"""
+    def crawl_section(self, section_key, page):
+        """
+        특정 섹션 크롤링
+        
+        page(Playwright Page)는 호출자가 생성/종료하며, 호출 전에 open_outputs(section_key)로
+        결과 파일을 열어 두어야 한다 (기사는 수집 즉시 파일에 기록됨).
+        """
         section = self.SECTIONS[section_key]
         url = section['url']
         name_kr = section['name_kr']
@@ -146,51 +261,54 @@ class FaceIraqMultiCrawler:
         print(f"URL: {url}")
         print(f"{'='*60}\n")
         
-        self.driver.get(url)
-        time.sleep(3)
+        page.goto(url, wait_until='domcontentloaded')
+        try:
+            # 첫 카드가 렌더링될 때까지 대기
+            page.wait_for_selector('div.v-card', timeout=10000)
+        except PlaywrightTimeoutError:
+            logger.warning(f"⚠️ {name_kr} 섹션에서 기사 카드를 찾지 못했습니다")
         
         scroll_count = 0
         max_scrolls = 10
         old_articles_count = 0
         max_old_articles = 5
+        last_processed = 0
+        
+        # 카드 루프에서 반복 조회하지 않도록 지역 변수로 바인딩
+        seen = self.results[section_key]['seen_titles']
+        articles = self.results[section_key]['articles']
+        seen_add = seen.add
+        articles_append = articles.append
+        write_article = self.write_article
+        parse_time = self.parse_time
+        cutoff = self.cutoff_epoch
+        blake2b = hashlib.blake2b
+        now = int(time.time())  # 섹션 단위 기준 시각 (상대 시간 파싱용, epoch 초)
         
         while scroll_count < max_scrolls:
-            # 페이지 소스 가져오기
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # v-card 찾기
-            cards = soup.find_all('div', class_='v-card')
+            # 새 v-card 정보를 한 번의 스크립트 호출로 추출 (이전 스크롤에서 처리한 카드는 건너뜀)
+            last_processed, records = page.evaluate(_EXTRACT_CARDS_JS, last_processed)
             
-            for card in cards:
+            for raw_title, raw_time, source, href in records:
                 try:
                     # 제목 추출
-                    title_elem = card.find('p', class_='article-title')
-                    if not title_elem:
+                    title = raw_title.strip()
+                    if not title:
                         continue
-                    title = title_elem.get_text(strip=True)
                     
-                    # 중복 체크
-                    if title in self.results[section_key]['seen_titles']:
+                    # 중복 체크 (제목 원문 대신 8바이트 BLAKE2b 지문 저장)
+                    title_hash = blake2b(title.encode('utf-8'), digest_size=8).digest()
+                    if title_hash in seen:
                         continue
                     
-                    # 시간 추출
-                    time_elem = card.find('div', class_='v-card-subtitle')
-                    time_text = time_elem.get_text(strip=True) if time_elem else ''
-                    
-                    # 출처 추출
-                    img_elem = card.find('img')
-                    source = img_elem.get('title', 'Unknown') if img_elem else 'Unknown'
-                    
-                    # URL 추출
-                    link_elem = card.find('a', href=True)
-                    article_url = 'https://www.faceiraq.org' + link_elem['href'] if link_elem else ''
+                    time_text = raw_time.strip()
+                    article_url = 'https://www.faceiraq.org' + href if href else ''
                     
                     # 시간 파싱
-                    publish_date = self.parse_time(time_text)
+                    publish_epoch = parse_time(time_text, now)
                     
                     # 시간 제한 확인
-                    if not self.is_within_time_limit(publish_date):
+                    if publish_epoch < cutoff:
                         old_articles_count += 1
                         if old_articles_count >= max_old_articles:
                             print(f"✓ 24시간 이전 기사 {max_old_articles}개 발견, 크롤링 종료")
@@ -202,64 +320,92 @@ class FaceIraqMultiCrawler:
                         'section': name_kr,
                         'section_key': section_key,
                         'title': title,
-                        'publishDate': publish_date.isoformat() + 'Z',
+                        'publishDate': datetime.utcfromtimestamp(publish_epoch).isoformat() + 'Z',
                         'timeText': time_text,
                         'source': source,
                         'url': article_url
                     }
                     
-                    self.results[section_key]['articles'].append(article)
-                    self.results[section_key]['seen_titles'].add(title)
+                    articles_append(article)
+                    write_article(section_key, article)
+                    seen_add(title_hash)
                     
-                    print(f"✓ [{name_kr}] {title[:50]}... ({source})")
+                    logger.info(f"✓ [{name_kr}] {title[:50]}... ({source})")
                 
                 except Exception as e:
                     continue
             
-            # 스크롤
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            # 스크롤 후 새 카드가 로드될 때까지 대기 (고정 sleep 대신)
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                page.wait_for_function(_MORE_CARDS_JS, arg=last_processed, timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
             scroll_count += 1
             
-            print(f"  스크롤 {scroll_count}/{max_scrolls} (수집: {len(self.results[section_key]['articles'])}개)")
+            logger.info(f"  스크롤 {scroll_count}/{max_scrolls} (수집: {len(articles)}개)")
         
-        print(f"\n✓ {name_kr} 섹션 크롤링 완료: {len(self.results[section_key]['articles'])}개 기사")
+        print(f"\n✓ {name_kr} 섹션 크롤링 완료: {len(articles)}개 기사")
     
-    def save_results(self, section_key):
-        """섹션별 결과를 JSON 및 CSV 파일로 저장"""
-        articles = self.results[section_key]['articles']
-        section_name = self.SECTIONS[section_key]['name_kr']
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def open_outputs(self, section_key):
+        """섹션 결과 JSON/CSV 파일을 열고 헤더 기록 (기사는 수집 즉시 write_article로 추가)"""
+        json_filename = f"faceiraq_{section_key}_{self.timestamp}.json"
+        csv_filename = f"faceiraq_{section_key}_{self.timestamp}.csv"
         
-        # 최신순 정렬
-        articles.sort(key=lambda x: x.get('publishDate', ''), reverse=True)
+        json_file = open(json_filename, 'wb')
+        json_file.write(b'[')
+        csv_file = open(csv_filename, 'w', encoding='utf-8', newline='')
+        csv_file.write(','.join(CSV_FIELDNAMES) + '\n')
         
-        # JSON 저장
-        json_filename = f"faceiraq_{section_key}_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
-        print(f"✓ JSON 파일 저장: {json_filename}")
+        self.outputs[section_key] = {
+            'json_filename': json_filename,
+            'csv_filename': csv_filename,
+            'json_file': json_file,
+            'csv_file': csv_file,
+            'count': 0
+        }
+    
+    def write_article(self, section_key, article):
+        """기사 한 건을 JSON/CSV 파일에 바로 기록"""
+        output = self.outputs[section_key]
         
-        # CSV 저장
-        csv_filename = f"faceiraq_{section_key}_{timestamp}.csv"
-        with open(csv_filename, 'w', encoding='utf-8', newline='') as f:
-            if articles:
-                fieldnames = ['section', 'arabic_title', 'korean_title', 'publishDate', 'timeText', 'source', 'url']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for article in articles:
-                    writer.writerow({
-                        'section': article.get('section', ''),
-                        'arabic_title': article.get('title', ''),
-                        'korean_title': '',  # GPT로 번역 필요
-                        'publishDate': article.get('publishDate', ''),
-                        'timeText': article.get('timeText', ''),
-                        'source': article.get('source', ''),
-                        'url': article.get('url', '')
-                    })
-        print(f"✓ CSV 파일 저장: {csv_filename}")
+        # JSON: 첫 기사 앞에는 구분자 없이, 이후에는 ',' 뒤에 기록
+        output['json_file'].write(b'\n' if output['count'] == 0 else b',\n')
+        output['json_file'].write(dumps_json(article))
+        
+        # CSV: 필드 안의 '"'는 '""'로 이스케이프
+        output['csv_file'].write(_CSV_ROW_FMT.format(*(
+            article.get(key, '').replace('"', '""')
+            for key in ('section', 'title', 'publishDate', 'timeText', 'source', 'url')
+        )))
+        output['count'] += 1
+    
+    def finalize(self, section_key):
+        """
+        섹션 결과 파일을 닫기
+        
+        기사가 하나도 없으면 파일을 삭제한다.
+        
+        Returns:
+            (json_filename, csv_filename) 또는 기사가 없으면 None
+        """
+        output = self.outputs.pop(section_key, None)
+        if output is None:
+            return None
+        
+        output['json_file'].write(b'\n]\n')
+        output['json_file'].close()
+        output['csv_file'].close()
+        
+        json_filename = output['json_filename']
+        csv_filename = output['csv_filename']
+        if output['count'] == 0:
+            os.remove(json_filename)
+            os.remove(csv_filename)
+            return None
         
+        print(f"✓ JSON 파일 저장: {json_filename}")
+        print(f"✓ CSV 파일 저장: {csv_filename}")
         return json_filename, csv_filename
     
     def print_summary(self):
@@ -299,18 +445,12 @@ class FaceIraqMultiCrawler:
             print(f"수집 섹션: {', '.join([self.SECTIONS[s]['name_kr'] for s in self.target_sections])}")
             print(f"시간 범위: 최근 {self.hours_limit}시간\n")
             
-            # 각 섹션 크롤링
-            for section_key in self.target_sections:
-                self.crawl_section(section_key)
-            
-            # 결과 저장
-            print(f"\n{'='*60}")
-            print("💾 결과 저장 중...")
-            print(f"{'='*60}\n")
-            
-            for section_key in self.target_sections:
-                if self.results[section_key]['articles']:
-                    self.save_results(section_key)
+            # 섹션별로 별도 프로세스/브라우저에서 병렬 크롤링
+            worker_args = [(section_key, self.hours_limit) for section_key in self.target_sections]
+            with multiprocessing.Pool(max(1, len(worker_args)), initializer=configure_logging,
+                                      initargs=(logger.getEffectiveLevel(),)) as pool:
+                for section_key, articles in pool.starmap(crawl_section_worker, worker_args):
+                    self.results[section_key]['articles'] = articles
             
             # 요약 출력
             self.print_summary()
@@ -319,9 +459,30 @@ class FaceIraqMultiCrawler:
             print(f"\n❌ 오류 발생: {str(e)}")
             import traceback
             traceback.print_exc()
-        
-        finally:
-            self.driver.quit()
+
+
+def crawl_section_worker(section_key, hours_limit):
+    """
+    워커 프로세스에서 한 섹션을 크롤링하고 결과 파일을 기록
+    
+    Playwright 동기 API는 스레드 간 공유가 안전하지 않으므로 프로세스마다 브라우저를 새로 실행한다.
+    
+    Returns:
+        (section_key, articles) 튜플
+    """
+    crawler = FaceIraqMultiCrawler(hours_limit=hours_limit, sections=[section_key])
+    crawler.open_outputs(section_key)
+    try:
+        with sync_playwright() as playwright:
+            browser = launch_browser(playwright)
+            try:
+                crawler.crawl_section(section_key, create_page(browser))
+            finally:
+                browser.close()
+    finally:
+        # 오류로 중단되어도 그때까지 수집한 기사는 파일에 남김
+        crawler.finalize(section_key)
+    return section_key, crawler.results[section_key]['articles']
 
 
 def main():
@@ -330,8 +491,11 @@ def main():
                         help='수집할 시간 범위 (기본: 24시간)')
     parser.add_argument('--sections', type=str, default=None,
                         help='수집할 섹션 (쉼표로 구분, 예: politics,security,economy)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='기사별/스크롤별 진행 로그 숨김')
     
     args = parser.parse_args()
+    configure_logging(logging.WARNING if args.quiet else logging.INFO)
     
     # 섹션 파싱
     sections = None